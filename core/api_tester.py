@@ -62,7 +62,7 @@ class ApiTester:
         base_url = base_url.rstrip('/')
         path = path.lstrip('/') if path.startswith('/') else path
         
-        logger.debug(f"规范化后: base_url='{base_url}', path='{path}'")
+        logger.debug("规范化后: base_url='%s', path='%s'", base_url, path)
         
         # 检查是否存在路径重复
         # 例如：base_url = "http://localhost:8081/customer" 和 path = "customer/work-register/export/detail/92"
@@ -73,7 +73,7 @@ class ApiTester:
         base_path_parts = [p for p in parsed_base.path.split('/') if p]  # 移除空字符串
         path_parts = [p for p in path.split('/') if p]  # 移除空字符串
         
-        logger.debug(f"base_path_parts: {base_path_parts}, path_parts: {path_parts}")
+        logger.debug("base_path_parts: %s, path_parts: %s", base_path_parts, path_parts)
         
         # 检查path是否以base_url中的路径部分开头
         if base_path_parts and path_parts:
@@ -91,7 +91,7 @@ class ApiTester:
                 # 移除重复的部分
                 path_parts = path_parts[common_start:]
                 path = '/'.join(path_parts)
-                logger.debug(f"检测到路径重复，移除{common_start}个重复段，新path: '{path}'")
+                logger.debug("检测到路径重复，移除%s个重复段，新path: '%s'", common_start, path)
         
         # 拼接URL
         if path:
@@ -99,7 +99,7 @@ class ApiTester:
         else:
             full_url = base_url
         
-        logger.debug(f"最终URL: '{full_url}'")
+        logger.debug("最终URL: '%s'", full_url)
         return full_url
         
     def test_api(self, api_info, custom_data=None, use_auth=True, auth_type="bearer"):
@@ -139,7 +139,7 @@ class ApiTester:
             # 智能URL拼接，避免路径重复
             full_url = self._build_full_url(self.base_url, path)
             
-            logger.debug(f"URL拼接: base_url='{self.base_url}', path='{path}', full_url='{full_url}'")
+            logger.debug("URL拼接: base_url='%s', path='%s', full_url='%s'", self.base_url, path, full_url)
             
             # 获取请求方法
             method = api_info.get('method', 'GET').upper()
@@ -158,7 +158,7 @@ class ApiTester:
                     'headers': custom_data.get('headers', {}),
                     'body': custom_data.get('body')
                 }
-                logger.debug(f"使用自定义数据: {request_data}")
+                logger.debug("使用自定义数据: %s", request_data)
             else:
                 # 为路径参数、查询参数和请求体生成数据
                 parameters = api_info.get('parameters', [])
@@ -173,13 +173,13 @@ class ApiTester:
                     'headers': param_data.get('header', {}),
                     'body': body_data or param_data.get('body')
                 }
-                logger.debug(f"使用生成数据: {request_data}")
+                logger.debug("使用生成数据: %s", request_data)
             
             # 替换URL中的路径参数
             for param_name, param_value in request_data.get('path_params', {}).items():
                 old_url = full_url
                 full_url = full_url.replace(f"{{{param_name}}}", str(param_value))
-                logger.debug(f"路径参数替换: {param_name}={param_value}, URL: {old_url} -> {full_url}")
+                logger.debug("路径参数替换: %s=%s, URL: %s -> %s", param_name, param_value, old_url, full_url)
 
             # 构建请求参数
             query_params = request_data.get('query_params', {})
@@ -203,28 +203,28 @@ class ApiTester:
 
             # 添加请求体（如果有）
             body_data = request_data.get('body')
-            logger.debug(f"请求体数据: {body_data}, 类型: {type(body_data)}")
+            logger.debug("请求体数据: %s, 类型: %s", body_data, type(body_data))
 
             # 支持所有可能有请求体的方法，包括DELETE
             if body_data is not None and method in ['POST', 'PUT', 'PATCH', 'DELETE']:
                 if isinstance(body_data, (dict, list)):
                     # 对于字典和列表，使用json参数
                     request_kwargs['json'] = body_data
-                    logger.debug(f"设置JSON请求体: {body_data}")
+                    logger.debug("设置JSON请求体: %s", body_data)
                 elif isinstance(body_data, str) and body_data.strip():
                     # 对于字符串，尝试解析为JSON
                     try:
                         import json
                         parsed_data = json.loads(body_data)
                         request_kwargs['json'] = parsed_data
-                        logger.debug(f"设置解析后的JSON请求体: {parsed_data}")
+                        logger.debug("设置解析后的JSON请求体: %s", parsed_data)
                     except json.JSONDecodeError:
                         # 如果不是有效JSON，作为普通文本处理
                         request_kwargs['data'] = body_data
-                        logger.debug(f"设置文本请求体: {body_data}")
+                        logger.debug("设置文本请求体: %s", body_data)
                 else:
                     request_kwargs['data'] = body_data
-                    logger.debug(f"设置其他类型请求体: {body_data}")
+                    logger.debug("设置其他类型请求体: %s", body_data)
 
             # 设置请求头的Content-Type
             if method in ['POST', 'PUT', 'PATCH', 'DELETE'] and isinstance(body_data, (dict, list)):
@@ -237,7 +237,7 @@ class ApiTester:
             # 应用认证（如果需要）
             if use_auth:
                 request_kwargs = self.auth_manager.apply_auth(request_kwargs, auth_type)
-                logger.debug(f"应用{auth_type}认证")
+                logger.debug("应用%s认证", auth_type)
             
             # 记录请求信息
             test_result['request'] = {
@@ -390,7 +390,7 @@ class ApiTester:
                     'params': test_result.get('query_params', {}),
                     'data': test_result.get('request_body')
                 }
-                logger.debug(f"从结果格式构建request: {request}")
+                logger.debug("从结果格式构建request: %s", request)
             else:
                 logger.error(f"test_result 中没有 request 字段且无法从其他字段构建: {test_result.keys()}")
                 return ""
@@ -413,7 +413,7 @@ class ApiTester:
             
             # 重新构建URL
             url = self._build_full_url(self.base_url, original_path)
-            logger.debug(f"重新构建URL: base_url='{self.base_url}', path='{original_path}', new_url='{url}'")
+            logger.debug("重新构建URL: base_url='%s', path='%s', new_url='%s'", self.base_url, original_path, url)
         
         headers = request.get('headers', {}).copy()  # 复制以避免修改原始数据
         params = request.get('params', {})
@@ -423,7 +423,7 @@ class ApiTester:
         use_auth = test_result.get('use_auth', True)
         auth_type = test_result.get('auth_type', 'bearer')
         
-        logger.debug(f"generate_curl_command - use_auth: {use_auth}, auth_type: {auth_type}")
+        logger.debug("generate_curl_command - use_auth: %s, auth_type: %s", use_auth, auth_type)
         
         if use_auth and self.auth_manager:
             auth_config = self.auth_manager.get_auth_config('bearer')
@@ -431,7 +431,7 @@ class ApiTester:
             
             if auth_type == 'bearer':
                 token = self.auth_manager.get_bearer_token()
-                logger.debug(f"Bearer token: {'[EXISTS]' if token else '[EMPTY]'}")
+                logger.debug("Bearer token: %s", '[EXISTS]' if token else '[EMPTY]')
                 if token:
                     if use_prefix:
                         headers['Authorization'] = f'Bearer {token}'
@@ -440,7 +440,8 @@ class ApiTester:
             elif auth_type == 'basic':
                 username = self.auth_manager.get_basic_username()
                 password = self.auth_manager.get_basic_password()
-                logger.debug(f"Basic auth - username: {'[EXISTS]' if username else '[EMPTY]'}, password: {'[EXISTS]' if password else '[EMPTY]'}")
+                logger.debug("Basic auth - username: %s, password: %s",
+                             '[EXISTS]' if username else '[EMPTY]', '[EXISTS]' if password else '[EMPTY]')
                 if username and password:
                     import base64
                     credentials = base64.b64encode(f'{username}:{password}'.encode()).decode()
@@ -448,11 +449,11 @@ class ApiTester:
             elif auth_type == 'api_key':
                 api_key = self.auth_manager.get_api_key()
                 api_key_header = self.auth_manager.get_api_key_header()
-                logger.debug(f"API Key - key: {'[EXISTS]' if api_key else '[EMPTY]'}, header: {api_key_header}")
+                logger.debug("API Key - key: %s, header: %s", '[EXISTS]' if api_key else '[EMPTY]', api_key_header)
                 if api_key and api_key_header:
                     headers[api_key_header] = api_key
         
-        logger.debug(f"Final headers for cURL: {headers}")
+        logger.debug("Final headers for cURL: %s", headers)
         
         # 构建基本命令
         curl_command = f'curl -X {method}'
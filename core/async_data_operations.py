@@ -12,7 +12,7 @@ import time
 import logging
 import sqlite3
 from typing import Any, Dict, List, Optional, Callable, Union, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, Future
@@ -567,13 +567,15 @@ class AsyncDataOperationSystem:
     
     def cleanup_completed_operations(self, max_age_hours: int = 24):
         """清理已完成的操作"""
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
+        # 直接比较datetime，避免逐条转换为时间戳
+        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        finished_statuses = (OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED)
         
         operations_to_remove = []
         for op_id, operation in self.operations.items():
-            if (operation.status in [OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED] 
+            if (operation.status in finished_statuses
                 and operation.completed_at 
-                and operation.completed_at.timestamp() < cutoff_time):
+                and operation.completed_at < cutoff_time):
                 operations_to_remove.append(op_id)
         
         for op_id in operations_to_remove:
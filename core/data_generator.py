@@ -8,10 +8,35 @@
 import random
 import string
 import json
-from faker import Faker
 
-# 初始化Faker
-fake = Faker('zh_CN')
+
+class _LazyFaker:
+    """
+    延迟初始化的Faker代理，首次使用时才导入faker并加载本地化数据
+    """
+
+    def __init__(self, locale):
+        self._locale = locale
+        self._faker = None
+
+    def __getattr__(self, name):
+        if self._faker is None:
+            from faker import Faker
+            self._faker = Faker(self._locale)
+        return getattr(self._faker, name)
+
+
+# 初始化Faker（延迟加载）
+fake = _LazyFaker('zh_CN')
+
+# 随机字符串使用的字符集
+_ALPHANUMERIC = string.ascii_letters + string.digits
+
+# 根据字段名推断数据类型的提示词
+_PHONE_HINTS = ('phone', 'mobile', 'tel', '手机', '电话', '联系方式', 'phonenumber', 'mobilenumber')
+_NAME_HINTS = ('name', 'username', '名称', '姓名', '用户名')
+_EMAIL_HINTS = ('email', '邮箱', '邮件')
+_ADDRESS_HINTS = ('address', 'location', '地址', '位置')
 
 
 class DataGenerator:
@@ -415,7 +440,7 @@ class DataGenerator:
             pattern = schema['pattern']
             # 处理手机号模式
             if 'phone' in schema.get('description', '').lower() or 'phone' in schema.get('name', '').lower() or '^1[3-9]\\d{9}$' in pattern:
-                return '1' + str(random.randint(3, 9)) + ''.join(str(random.randint(0, 9)) for _ in range(9))
+                return '1' + str(random.randint(3, 9)) + ''.join(random.choices(string.digits, k=9))
             # 处理邮箱模式
             elif '@' in pattern:
                 return fake.email()
@@ -426,14 +451,14 @@ class DataGenerator:
                 length_match = re.search(r'\{(\d+)\}', pattern)
                 if length_match:
                     length = int(length_match.group(1))
-                    return ''.join(str(random.randint(0, 9)) for _ in range(length))
+                    return ''.join(random.choices(string.digits, k=length))
                 else:
-                    return ''.join(str(random.randint(0, 9)) for _ in range(6))  # 默认6位
+                    return ''.join(random.choices(string.digits, k=6))  # 默认6位
             # 其他模式，返回合理的默认值
             else:
                 # 生成字母数字组合
                 length = random.randint(6, 12)
-                return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
+                return ''.join(random.choices(_ALPHANUMERIC, k=length))
         
         # 处理长度
         min_length = schema.get('minLength', 1)
@@ -447,29 +472,25 @@ class DataGenerator:
         field_desc = schema.get('description', '').lower()
         
         # 手机号检测 - 优先级最高
-        phone_hints = ['phone', 'mobile', 'tel', '手机', '电话', '联系方式', 'phonenumber', 'mobilenumber']
-        for hint in phone_hints:
+        for hint in _PHONE_HINTS:
             if hint in field_name or hint in field_title or hint in field_desc:
-                return '1' + str(random.randint(3, 9)) + ''.join(str(random.randint(0, 9)) for _ in range(9))
+                return '1' + str(random.randint(3, 9)) + ''.join(random.choices(string.digits, k=9))
         
-        name_hints = ['name', 'username', '名称', '姓名', '用户名']
-        for hint in name_hints:
+        for hint in _NAME_HINTS:
             if hint in field_name or hint in field_title:
                 return fake.name()
         
-        email_hints = ['email', '邮箱', '邮件']
-        for hint in email_hints:
+        for hint in _EMAIL_HINTS:
             if hint in field_name or hint in field_title:
                 return fake.email()
         
-        address_hints = ['address', 'location', '地址', '位置']
-        for hint in address_hints:
+        for hint in _ADDRESS_HINTS:
             if hint in field_name or hint in field_title:
                 return fake.address()
         
         # 生成随机字符串
         length = random.randint(min_length, max_length)
-        return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
+        return ''.join(random.choices(_ALPHANUMERIC, k=length))
     
     def _generate_integer(self, schema):
         """
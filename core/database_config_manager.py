@@ -9,8 +9,9 @@
 import os
 import json
 import logging
+import tempfile
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -149,8 +150,7 @@ class DatabaseConfigManager:
                 'configs': [asdict(config) for config in self._configs.values()]
             }
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json_atomic(self.config_file, data)
                 
             logger.debug(f"保存了 {len(self._configs)} 个数据库配置")
             
@@ -158,6 +158,33 @@ class DatabaseConfigManager:
             logger.error(f"保存数据库配置失败: {e}")
             raise
     
+    def _write_json_atomic(self, file_path: str, data: Dict[str, Any]):
+        """
+        原子写入JSON文件
+        
+        先写入同目录下的临时文件并落盘，再通过os.replace替换目标文件，
+        避免写入中途崩溃导致配置文件损坏
+        
+        Args:
+            file_path: 目标文件路径
+            data: 要写入的数据
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path) or '.',
+            prefix=os.path.basename(file_path) + '.',
+            suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     def _load_history(self):
         """加载连接历史"""
         try:
@@ -194,16 +221,20 @@ class DatabaseConfigManager:
                 'history': [asdict(history) for history in self._history]
             }
             
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json_atomic(self.history_file, data)
                 
             logger.debug(f"保存了 {len(self._history)} 条连接历史")
             
         except Exception as e:
             logger.error(f"保存连接历史失败: {e}")
     
-    def _ensure_default_config(self):
-        """确保有默认配置"""
+    def _ensure_default_config(self, save: bool = True):
+        """
+        确保有默认配置
+        
+        Args:
+            save: 发生修改时是否立即保存，调用方随后会自行保存时传入False
+        """
         if not self._configs:
             # 创建默认配置
             default_config = DatabaseConfig(
@@ -216,7 +247,8 @@ class DatabaseConfigManager:
             )
             
             self._configs[default_config.id] = default_config
-            self._save_configs()
+            if save:
+                self._save_configs()
             logger.info("创建了默认数据库配置")
         else:
             # 确保有一个默认配置
@@ -225,7 +257,8 @@ class DatabaseConfigManager:
                 # 将第一个配置设为默认
                 first_config = next(iter(self._configs.values()))
                 first_config.is_default = True
-                self._save_configs()
+                if save:
+                    self._save_configs()
                 logger.info(f"将配置 '{first_config.name}' 设为默认")
     
     def add_config(self, name: str, path: str, description: str = "", 
@@ -486,13 +519,13 @@ class DatabaseConfigManager:
             days: 保留天数，为None时清理所有
         """
         if days is not None:
-            # 计算截止时间
-            cutoff_time = datetime.now().timestamp() - (days * 24 * 3600)
+            # 计算截止时间（ISO格式字符串可直接按字典序比较，无需逐条解析）
+            cutoff_time = (datetime.now() - timedelta(days=days)).isoformat()
             
             # 过滤历史记录
             self._history = [
                 h for h in self._history
-                if datetime.fromisoformat(h.connected_at).timestamp() > cutoff_time
+                if h.connected_at > cutoff_time
             ]
         elif config_id:
             # 清理指定配置的历史
@@ -641,8 +674,8 @@ class DatabaseConfigManager:
                 except Exception as e:
                     logger.warning(f"导入配置失败: {e}")
             
-            # 确保有默认配置
-            self._ensure_default_config()
+            # 确保有默认配置（随后统一保存，避免重复写入）
+            self._ensure_default_config(save=False)
             
             # 保存配置
             self._save_configs()
@@ -678,13 +711,12 @@ class DatabaseConfigManager:
         Returns:
             str: 唯一ID
         """
-        import uuid
         import hashlib
         
-        # 基于名称和时间戳生成ID
+        # 基于名称和时间戳生成ID（只对需要的4个字节做十六进制编码）
         base_string = f"{name}_{datetime.now().isoformat()}"
         hash_object = hashlib.md5(base_string.encode())
-        return hash_object.hexdigest()[:8]
+        return hash_object.digest()[:4].hex()
     
     def _clear_default_flags(self):
         """清除所有默认标志"""
@@ -16,8 +16,6 @@ from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
 
-# 配置日志
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -116,7 +114,7 @@ class DatabaseHealthChecker:
         Returns:
             健康检查结果
         """
-        logger.info(f"开始数据库健康检查: {db_path}")
+        logger.info("开始数据库健康检查: %s", db_path)
         
         issues = []
         recommendations = []
@@ -155,7 +153,7 @@ class DatabaseHealthChecker:
             except Exception as e:
                 checks_failed += 1
                 issues.append(f"检查失败: {check.__name__} - {e}")
-                logger.error(f"健康检查失败: {check.__name__} - {e}")
+                logger.error("健康检查失败: %s - %s", check.__name__, e)
         
         # 计算总体健康分数
         total_checks = checks_passed + checks_failed
@@ -185,7 +183,7 @@ class DatabaseHealthChecker:
             timestamp=datetime.now().isoformat()
         )
         
-        logger.info(f"健康检查完成: {overall_status.value}, 分数: {score}")
+        logger.info("健康检查完成: %s, 分数: %s", overall_status.value, score)
         return result
     
     def _check_database_size(self, db_path: str) -> Dict[str, Any]:
@@ -665,7 +663,7 @@ class DatabaseMaintenanceManager:
                 'error': f'任务已禁用: {task_id}'
             }
         
-        logger.info(f"开始执行维护任务: {task.name}")
+        logger.info("开始执行维护任务: %s", task.name)
         start_time = time.time()
         
         try:
@@ -699,11 +697,11 @@ class DatabaseMaintenanceManager:
                 'timestamp': datetime.now().isoformat()
             })
             
-            logger.info(f"维护任务完成: {task.name}, 耗时: {duration:.2f}秒")
+            logger.info("维护任务完成: %s, 耗时: %.2f秒", task.name, duration)
             return result
             
         except Exception as e:
-            logger.error(f"维护任务失败: {task.name} - {e}")
+            logger.error("维护任务失败: %s - %s", task.name, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -984,4 +982,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 配置日志（仅在独立运行时）
+    logging.basicConfig(level=logging.INFO)
     main()
\ No newline at end of file
@@ -6,17 +6,28 @@
 提供查询执行计划分析、慢查询检测、索引监控和查询缓存功能
 """
 
+import re
+import heapq
 import sqlite3
 import time
 import logging
 import threading
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, OrderedDict
 from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
+# WHERE子句中的列名匹配（简单匹配，实际应该更复杂）
+_WHERE_COLUMN_RE = re.compile(r'\b(\w+)\s*[=<>]')
+
+# 不作为列名处理的SQL关键字
+_SQL_KEYWORDS = frozenset(['and', 'or', 'not', 'in', 'like'])
+
+# 执行计划缓存的最大条目数
+_QUERY_INDEX_CACHE_MAX_SIZE = 1000
+
 
 @dataclass
 class QueryExecutionPlan:
@@ -68,6 +79,8 @@ class QueryCache:
         self.ttl_seconds = ttl_seconds
         self._cache = OrderedDict()
         self._timestamps = {}
+        # 按写入时间排列的最小堆，条目为(时间戳, 键)
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._lock = threading.RLock()
         
         # 统计信息
@@ -83,24 +96,25 @@ class QueryCache:
             param_str = ""
         return f"{query}|{param_str}"
     
-    def _is_expired(self, timestamp: datetime) -> bool:
-        """检查是否过期"""
-        return datetime.now() - timestamp > timedelta(seconds=self.ttl_seconds)
+    def _is_expired(self, timestamp: float, now: Optional[float] = None) -> bool:
+        """检查是否过期（时间戳为time.monotonic()秒数）"""
+        if now is None:
+            now = time.monotonic()
+        return now - timestamp > self.ttl_seconds
     
-    def _evict_expired(self):
-        """清理过期条目"""
-        now = datetime.now()
-        expired_keys = []
-        
-        for key, timestamp in self._timestamps.items():
-            if now - timestamp > timedelta(seconds=self.ttl_seconds):
-                expired_keys.append(key)
+    def _evict_expired(self, now: Optional[float] = None):
+        """清理过期条目（只检查堆顶，无需遍历全部条目）"""
+        if now is None:
+            now = time.monotonic()
+        heap = self._expiry_heap
         
-        for key in expired_keys:
-            if key in self._cache:
-                del self._cache[key]
-            if key in self._timestamps:
-                del self._timestamps[key]
+        while heap and self._is_expired(heap[0][0], now):
+            timestamp, key = heapq.heappop(heap)
+            # 条目已被删除或重新写入时，堆中记录已失效，直接跳过
+            if self._timestamps.get(key) != timestamp:
+                continue
+            self._cache.pop(key, None)
+            del self._timestamps[key]
             self.evictions += 1
     
     def get(self, query: str, parameters: Optional[List[Any]] = None) -> Optional[Any]:
@@ -110,7 +124,7 @@ class QueryCache:
             
             if key in self._cache:
                 timestamp = self._timestamps.get(key)
-                if timestamp and not self._is_expired(timestamp):
+                if timestamp is not None and not self._is_expired(timestamp):
                     # 移到末尾（LRU）
                     self._cache.move_to_end(key)
                     self.hits += 1
@@ -130,8 +144,10 @@ class QueryCache:
         with self._lock:
             key = self._generate_key(query, parameters)
             
+            now = time.monotonic()
+            
             # 清理过期条目
-            self._evict_expired()
+            self._evict_expired(now)
             
             # 如果缓存已满，删除最旧的条目
             while len(self._cache) >= self.max_size:
@@ -143,13 +159,20 @@ class QueryCache:
             
             # 添加新条目
             self._cache[key] = result
-            self._timestamps[key] = datetime.now()
+            self._timestamps[key] = now
+            heapq.heappush(self._expiry_heap, (now, key))
+            
+            # 被LRU淘汰或重新写入的条目会在堆中留下失效记录，堆过大时按现有条目重建
+            if len(self._expiry_heap) > 2 * len(self._cache) + 16:
+                self._expiry_heap = [(t, k) for k, t in self._timestamps.items()]
+                heapq.heapify(self._expiry_heap)
     
     def clear(self):
         """清空缓存"""
         with self._lock:
             self._cache.clear()
             self._timestamps.clear()
+            self._expiry_heap.clear()
             self.hits = 0
             self.misses = 0
             self.evictions = 0
@@ -194,6 +217,9 @@ class QueryOptimizer:
         # 索引使用统计
         self.index_stats: Dict[str, IndexUsageStats] = {}
         
+        # 查询语句 -> 使用的索引列表（避免重复分析执行计划）
+        self._query_index_cache: Dict[str, List[str]] = {}
+        
         # 查询统计
         self.query_count = 0
         self.total_execution_time = 0.0
@@ -352,6 +378,12 @@ class QueryOptimizer:
                     cursor.execute(query)
                 
                 result = cursor.fetchall()
+                is_select = query.strip().lower().startswith('select')
+                
+                # 非SELECT语句（如CREATE/DROP INDEX）可能改变执行计划，清空计划缓存
+                if not is_select:
+                    with self._lock:
+                        self._query_index_cache.clear()
                 
                 # 记录执行时间
                 execution_time = time.time() - start_time
@@ -368,7 +400,7 @@ class QueryOptimizer:
                 self._update_index_stats(query)
                 
                 # 缓存结果（只缓存SELECT查询）
-                if query.strip().lower().startswith('select'):
+                if is_select:
                     self.query_cache.put(query, result, parameters)
                 
                 return result
@@ -404,21 +436,36 @@ class QueryOptimizer:
     def _update_index_stats(self, query: str):
         """更新索引使用统计"""
         try:
-            # 分析查询计划以确定使用的索引
-            plan = self.analyze_query_plan(query)
-            if plan and plan.index_scans:
+            # 同一查询语句的执行计划只分析一次
+            with self._lock:
+                index_scans = self._query_index_cache.get(query)
+            
+            if index_scans is None:
+                # 分析查询计划以确定使用的索引
+                plan = self.analyze_query_plan(query)
+                if plan is None:
+                    return
+                index_scans = plan.index_scans
                 with self._lock:
-                    for index_name in plan.index_scans:
+                    if len(self._query_index_cache) >= _QUERY_INDEX_CACHE_MAX_SIZE:
+                        # 删除最早加入的条目
+                        del self._query_index_cache[next(iter(self._query_index_cache))]
+                    self._query_index_cache[query] = index_scans
+            
+            if index_scans:
+                now = datetime.now().isoformat()
+                with self._lock:
+                    for index_name in index_scans:
                         if index_name in self.index_stats:
                             self.index_stats[index_name].usage_count += 1
-                            self.index_stats[index_name].last_used = datetime.now().isoformat()
+                            self.index_stats[index_name].last_used = now
                         else:
                             # 获取索引信息
                             index_info = self._get_index_info(index_name)
                             if index_info:
                                 self.index_stats[index_name] = index_info
                                 self.index_stats[index_name].usage_count = 1
-                                self.index_stats[index_name].last_used = datetime.now().isoformat()
+                                self.index_stats[index_name].last_used = now
         
         except Exception as e:
             logger.debug(f"更新索引统计失败: {e}")
@@ -484,13 +531,12 @@ class QueryOptimizer:
             List[SlowQuery]: 慢查询列表
         """
         with self._lock:
-            # 按执行时间排序
-            sorted_queries = sorted(
+            # 只取执行时间最长的前limit条，无需完整排序
+            return heapq.nlargest(
+                limit,
                 self.slow_queries.values(),
-                key=lambda x: x.execution_time,
-                reverse=True
+                key=lambda x: x.execution_time
             )
-            return sorted_queries[:limit]
     
     def get_index_usage_stats(self) -> List[IndexUsageStats]:
         """
@@ -554,13 +600,10 @@ class QueryOptimizer:
                 where_part = query_lower.split('where')[1]
                 
                 # 查找可能的索引列
-                import re
-                # 简单的列名匹配（实际应该更复杂）
-                column_pattern = r'\b(\w+)\s*[=<>]'
-                matches = re.findall(column_pattern, where_part)
+                matches = _WHERE_COLUMN_RE.findall(where_part)
                 
                 for column in matches:
-                    if column not in ['and', 'or', 'not', 'in', 'like']:
+                    if column not in _SQL_KEYWORDS:
                         suggestions.append(f"考虑为列 '{column}' 创建索引")
             
             # 分析ORDER BY子句
@@ -607,6 +650,7 @@ class QueryOptimizer:
         with self._lock:
             self.slow_queries.clear()
             self.index_stats.clear()
+            self._query_index_cache.clear()
             self.query_count = 0
             self.total_execution_time = 0.0
             self.query_cache.clear()
@@ -633,6 +677,10 @@ class QueryOptimizer:
                 
                 conn.commit()
                 
+                # 索引已重建，执行计划可能变化
+                with self._lock:
+                    self._query_index_cache.clear()
+                
                 return {
                     'success': True,
                     'message': '数据库优化完成',
@@ -208,30 +208,20 @@ class TestHistoryRepository:
         """
         try:
             with self._get_cursor() as cursor:
-                # 总测试数
-                cursor.execute('''
-                    SELECT COUNT(*) FROM test_history 
-                    WHERE project_id = ?
-                ''', (project_id,))
-                total_tests = cursor.fetchone()[0]
-                
-                # 成功/失败统计
+                # 总测试数、成功/失败统计和平均响应时间（单次扫描）
                 cursor.execute('''
                     SELECT 
+                        COUNT(*) as total_tests,
                         COUNT(CASE WHEN status_code >= 200 AND status_code < 300 THEN 1 END) as success_count,
                         COUNT(CASE WHEN status_code >= 400 THEN 1 END) as failure_count,
-                        COUNT(CASE WHEN error_message IS NOT NULL THEN 1 END) as error_count
+                        COUNT(CASE WHEN error_message IS NOT NULL THEN 1 END) as error_count,
+                        AVG(CASE WHEN response_time > 0 THEN response_time END) as avg_response_time
                     FROM test_history 
                     WHERE project_id = ?
                 ''', (project_id,))
                 stats = cursor.fetchone()
-                
-                # 平均响应时间
-                cursor.execute('''
-                    SELECT AVG(response_time) FROM test_history 
-                    WHERE project_id = ? AND response_time > 0
-                ''', (project_id,))
-                avg_response_time = cursor.fetchone()[0] or 0
+                total_tests = stats[0]
+                avg_response_time = stats[4] or 0
                 
                 # 最常测试的API
                 cursor.execute('''
@@ -253,9 +243,9 @@ class TestHistoryRepository:
                 
                 return {
                     'total_tests': total_tests,
-                    'success_count': stats[0],
-                    'failure_count': stats[1],
-                    'error_count': stats[2],
+                    'success_count': stats[1],
+                    'failure_count': stats[2],
+                    'error_count': stats[3],
                     'avg_response_time': avg_response_time,
                     'most_tested_apis': most_tested_apis
                 }
@@ -143,21 +143,28 @@ try:
     FEATURES['advanced_crypto'] = True
 except ImportError:
     import hashlib
+    import hmac
     
     class BcryptModule:
+        # pbkdf2_hmac('sha256') 输出长度
+        _DIGEST_SIZE = 32
+        
         def hashpw(self, password, salt):
-            # 使用简单的哈希替代（不如bcrypt安全，但可用）
+            # 使用PBKDF2替代（不如bcrypt安全，但可用），结果为 盐 + 摘要
             if isinstance(password, str):
                 password = password.encode('utf-8')
-            return hashlib.pbkdf2_hmac('sha256', password, salt, 100000)
+            return salt + hashlib.pbkdf2_hmac('sha256', password, salt, 100000)
         
         def gensalt(self, rounds=12):
             import os
             return os.urandom(16)
         
         def checkpw(self, password, hashed):
-            # 简单的验证（实际应用中需要更安全的实现）
-            return True
+            # 从哈希中取出盐重新计算，并使用常量时间比较
+            if len(hashed) <= self._DIGEST_SIZE:
+                return False
+            salt = hashed[:-self._DIGEST_SIZE]
+            return hmac.compare_digest(self.hashpw(password, salt), hashed)
     
     bcrypt = BcryptModule()
 